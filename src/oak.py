@@ -1,9 +1,9 @@
 # Standard library
+import asyncio
 import io
 import logging
 import struct
 import threading
-import time
 from typing import (
     Any,
     Callable,
@@ -22,6 +22,7 @@ from typing_extensions import Self
 # Third party
 from google.protobuf.timestamp_pb2 import Timestamp
 import numpy as np
+from numpy.typing import NDArray
 from PIL import Image
 
 # Viam module
@@ -49,7 +50,7 @@ from src.worker_manager import WorkerManager
 
 LOGGER = getLogger(__name__)
 
-VALID_ATTRIBUTES = ["height_px", "width_px", "sensors", "frame_rate"]
+VALID_ATTRIBUTES = ["height_px", "width_px", "sensors", "frame_rate", "cpu_affinity"]
 
 # Be sure to update README.md if default attributes are changed
 DEFAULT_FRAME_RATE = 30
@@ -60,6 +61,10 @@ DEFAULT_IMAGE_MIMETYPE = CameraMimeType.JPEG
 COLOR_SENSOR = "color"
 DEPTH_SENSOR = "depth"
 
+# TODO RSDK-5676: why do we need to normalize by 1000 when depthAI says they return depth in mm?
+# TODO RSDK-5676: why do we need to negate the 1st and 2nd dimensions for image to be the correct orientation?
+PCD_AXIS_DIVISORS = np.array([-1000.0, -1000.0, 1000.0], dtype=np.float32)
+
 ### TODO RSDK-5592: remove the below bandaid fix
 # once https://github.com/luxonis/depthai/pull/1135 is in a new release
 root_logger = logging.getLogger()
@@ -104,8 +109,9 @@ class Oak(Camera, Reconfigurable, Stoppable):
     """Singleton `Worker` handles camera logic in a separate thread"""
     worker_manager: ClassVar[Optional[WorkerManager]] = None
     """Singleton `WorkerManager` managing the lifecycle of `worker`"""
-    get_point_cloud_was_invoked: ClassVar[bool] = False
     camera_properties: Camera.Properties
+    _depth_buf: Optional[bytearray]
+    _depth_pixel_buf: Optional[NDArray]
 
     @classmethod
     def new(
@@ -150,7 +156,7 @@ class Oak(Camera, Reconfigurable, Stoppable):
             """
             full_err_msg = f"Config attribute validation error: {err_msg}"
             LOGGER.error(full_err_msg)
-            if cls.worker:  # stop worker if active
+            if cls.worker is not None:  # stop worker if active
                 cls.worker.stop()
             raise ValidationError(full_err_msg)
 
@@ -254,6 +260,19 @@ class Oak(Camera, Reconfigurable, Stoppable):
                 'received only one dimension attribute. Please supply both "height_px" and "width_px", or neither.'
             )
 
+        # Check CPU affinity
+        cpu_affinity_value = attribute_map.get(key="cpu_affinity", default=None)
+        if cpu_affinity_value is not None:
+            validate_attribute_type("cpu_affinity", "list_value")
+            cpu_list = list(cpu_affinity_value.list_value)
+            if len(cpu_list) == 0:
+                handle_error('"cpu_affinity" attribute list cannot be empty.')
+            for cpu in cpu_list:
+                if not isinstance(cpu, float) or int(cpu) != cpu or cpu < 0:
+                    handle_error(
+                        f'"cpu_affinity" must only contain whole numbers >= 0, not {cpu}.'
+                    )
+
     def reconfigure(
         self, config: ComponentConfig, dependencies: Mapping[ResourceName, ResourceBase]
     ) -> None:
@@ -278,6 +297,8 @@ class Oak(Camera, Reconfigurable, Stoppable):
             distortion_parameters=None,
             intrinsic_parameters=None,
         )
+        self._depth_buf = None
+        self._depth_pixel_buf = None
         attribute_map = config.attributes.fields
         self.sensors = list(attribute_map["sensors"].list_value)
         LOGGER.debug(f"Set sensors attr to {self.sensors}")
@@ -287,6 +308,10 @@ class Oak(Camera, Reconfigurable, Stoppable):
         LOGGER.debug(f"Set width attr to {self.width}")
         self.frame_rate = attribute_map["frame_rate"].number_value or DEFAULT_FRAME_RATE
         LOGGER.debug(f"Set frame_rate attr to {self.frame_rate}")
+        self.cpu_affinity = [
+            int(cpu) for cpu in attribute_map["cpu_affinity"].list_value
+        ]
+        LOGGER.debug(f"Set cpu_affinity attr to {self.cpu_affinity}")
 
         user_wants_color, user_wants_depth = (
             COLOR_SENSOR in self.sensors,
@@ -300,12 +325,13 @@ class Oak(Camera, Reconfigurable, Stoppable):
             frame_rate=self.frame_rate,
             user_wants_color=user_wants_color,
             user_wants_depth=user_wants_depth,
-            user_wants_pc=cls.get_point_cloud_was_invoked,
             reconfigure=callback,
             logger=LOGGER,
         )
 
-        cls.worker_manager = WorkerManager(cls.worker, LOGGER, callback)
+        cls.worker_manager = WorkerManager(
+            cls.worker, LOGGER, callback, cpu_affinity=self.cpu_affinity
+        )
         cls.worker_manager.start()
 
     def stop(
@@ -327,7 +353,8 @@ class Oak(Camera, Reconfigurable, Stoppable):
         if timeout:
             self._run_with_timeout(timeout, cls.worker_manager.stop)
         else:
-            cls.worker.stop()
+            # Going through the manager stops it from treating the closed camera as a disconnect
+            cls.worker_manager.stop()
 
     async def get_image(
         self,
@@ -357,25 +384,25 @@ class Oak(Camera, Reconfigurable, Stoppable):
         mime_type = self._validate_get_image_mime_type(mime_type)
         cls: Oak = type(self)
 
-        self._wait_until_worker_running()
+        await self._wait_until_worker_running()
 
         main_sensor = self.sensors[0]
 
         if main_sensor == COLOR_SENSOR:
             if mime_type == CameraMimeType.JPEG:
-                captured_data = cls.worker.get_color_image()
-                return Image.fromarray(captured_data.np_array, "RGB")
+                captured_data = await cls.worker.get_color_image()
+                return self._bgr_to_image(captured_data.np_array)
             raise NotSupportedError(
                 f'mime_type "{mime_type}" is not supported for color. Please use {CameraMimeType.JPEG}'
             )
 
         if main_sensor == DEPTH_SENSOR:
-            captured_data = cls.worker.get_depth_map()
+            captured_data = await cls.worker.get_depth_map()
             arr = captured_data.np_array
             if mime_type == CameraMimeType.JPEG:
                 return Image.fromarray(arr, "I;16").convert("RGB")
             if mime_type == CameraMimeType.VIAM_RAW_DEPTH:
-                encoded_bytes = self._encode_depth_raw(arr.tobytes(), arr.shape)
+                encoded_bytes = self._encode_depth_raw(arr)
                 return RawImage(encoded_bytes, mime_type)
             raise NotSupportedError(
                 f"mime_type {mime_type} is not supported for depth. Please use {CameraMimeType.JPEG} or {CameraMimeType.VIAM_RAW_DEPTH}."
@@ -403,7 +430,7 @@ class Oak(Camera, Reconfigurable, Stoppable):
         LOGGER.debug("get_images called")
         cls: Oak = type(self)
 
-        self._wait_until_worker_running()
+        await self._wait_until_worker_running()
 
         # Accumulator for images
         images: List[NamedImage] = []
@@ -417,10 +444,10 @@ class Oak(Camera, Reconfigurable, Stoppable):
 
         if COLOR_SENSOR in self.sensors:
             if color_data is None:
-                color_data: CapturedData = cls.worker.get_color_image()
+                color_data: CapturedData = await cls.worker.get_color_image()
             arr, captured_at = color_data.np_array, color_data.captured_at
             # Create a Pillow image from the raw data
-            pil_image = Image.fromarray(arr)
+            pil_image = self._bgr_to_image(arr)
 
             # Create a BytesIO buffer to save the image as JPEG
             output_buffer = io.BytesIO()
@@ -435,10 +462,10 @@ class Oak(Camera, Reconfigurable, Stoppable):
             images.append(img)
 
         if DEPTH_SENSOR in self.sensors:
-            if not depth_data:
-                depth_data: CapturedData = cls.worker.get_depth_map()
+            if depth_data is None:
+                depth_data: CapturedData = await cls.worker.get_depth_map()
             arr, captured_at = depth_data.np_array, depth_data.captured_at
-            depth_encoded_bytes = self._encode_depth_raw(arr.tobytes(), arr.shape)
+            depth_encoded_bytes = self._encode_depth_raw(arr)
             img = NamedImage(
                 "depth", depth_encoded_bytes, CameraMimeType.VIAM_RAW_DEPTH
             )
@@ -497,27 +524,18 @@ class Oak(Camera, Reconfigurable, Stoppable):
 
         cls = type(self)
 
-        self._wait_until_worker_running()
-
-        # By default, we do not get point clouds even when color and depth are both requested
-        # We have to reinitialize the worker/OakCamera to start making point clouds
-        if not cls.worker.user_wants_pc:
-            cls.get_point_cloud_was_invoked = True
-            cls.worker.oak.close()  # triggers reconfigure callback
-
-        while not cls.worker.user_wants_pc or not cls.worker.running:
-            LOGGER.debug("Waiting for worker to restart with pcd configured...")
-            time.sleep(0.5)
+        await self._wait_until_worker_running()
 
         # Get actual PCD data from camera worker
-        pcd_obj = cls.worker.get_pcd()
+        pcd_obj = await cls.worker.get_pcd()
         arr = pcd_obj.np_array
 
         # Done with pre-processing; create and send message now:
-        # TODO RSDK-5676: why do we need to normalize by 1000 when depthAI says they return depth in mm?
-        flat_array = arr.reshape(-1, arr.shape[-1]) / 1000.0
-        # TODO RSDK-5676: why do we need to negate the 1st and 2nd dimensions for image to be the correct orientation?
-        flat_array[:, 0:2] = -flat_array[:, 0:2]
+        # Normalizing, orienting, and converting to float32 happen in one pass over the xyz points,
+        # which stay interleaved since that is the layout binary PCD data uses
+        float_array = np.divide(
+            arr.reshape(-1, arr.shape[-1]), PCD_AXIS_DIVISORS, dtype=np.float32
+        )
         version = "VERSION .7\n"
         fields = "FIELDS x y z\n"
         size = "SIZE 4 4 4\n"
@@ -526,12 +544,12 @@ class Oak(Camera, Reconfigurable, Stoppable):
         height = "HEIGHT 1\n"
         viewpoint = "VIEWPOINT 0 0 0 1 0 0 0\n"
         data = "DATA binary\n"
-        width = f"WIDTH {len(flat_array)}\n"
-        points = f"POINTS {len(flat_array)}\n"
+        width = f"WIDTH {len(float_array)}\n"
+        points = f"POINTS {len(float_array)}\n"
         header = f"{version}{fields}{size}{type_of}{count}{width}{height}{viewpoint}{points}{data}"
         header_bytes = bytes(header, "UTF-8")
-        float_array = np.array(flat_array, dtype="f")
-        return (header_bytes + float_array.tobytes(), CameraMimeType.PCD)
+        # Joining with a memoryview copies the points once, where tobytes() and + would copy them twice
+        return (b"".join((header_bytes, memoryview(float_array))), CameraMimeType.PCD)
 
     async def get_properties(
         self, *, timeout: Optional[float] = None, **kwargs
@@ -544,9 +562,9 @@ class Oak(Camera, Reconfigurable, Stoppable):
         """
         return self.camera_properties
 
-    def _wait_until_worker_running(self, max_attempts=5, timeout_seconds=1):
+    async def _wait_until_worker_running(self, max_attempts=5, timeout_seconds=1):
         """
-        Blocks on camera data methods that require the worker to be running.
+        Waits in camera data methods that require the worker to be running.
         Unblocks once worker is running or max number of attempts to pass is reached.
 
         Args:
@@ -557,28 +575,63 @@ class Oak(Camera, Reconfigurable, Stoppable):
 
         """
         cls: Oak = type(self)
+        loop = asyncio.get_running_loop()
         attempts = 0
         while attempts < max_attempts:
-            if cls.worker.running:
+            # Re-read the worker on every attempt since reconfiguring replaces it.
+            # The wait blocks, so it runs in an executor thread to keep the event loop free
+            if await loop.run_in_executor(
+                None, cls.worker.wait_until_running, timeout_seconds
+            ):
                 return
-            time.sleep(timeout_seconds)
             attempts += 1
         raise ViamError(
             "Camera data requested before camera worker was ready. Please ensure the camera is properly "
             "connected and configured, especially for non-integrated models such as the OAK-FFC."
         )
 
-    def _encode_depth_raw(self, data: bytes, shape: Tuple[int, int]) -> bytes:
+    def _bgr_to_image(self, arr: NDArray) -> Image.Image:
         """
-        Encodes raw data into a bytes payload deserializable by the Viam SDK (camera mime type depth)
+        Creates an RGB Pillow image from a BGR frame. Pillow swaps the channels while
+        copying the frame into the image, so no intermediate RGB array is allocated.
 
         Args:
-            data (bytes): raw bytes
-            shape (Tuple[int, int]): output dimensions of depth map (height x width)
+            arr (NDArray): height x width x 3 BGR frame
+
+        Returns:
+            Image.Image: RGB image
+        """
+        height, width = arr.shape[:2]
+        return Image.frombuffer(
+            "RGB", (width, height), np.ascontiguousarray(arr), "raw", "BGR", 0, 1
+        )
+
+    def _encode_depth_raw(self, arr: NDArray) -> bytes:
+        """
+        Encodes a depth map into a bytes payload deserializable by the Viam SDK (camera mime type depth).
+        The encoding buffer and its header are reused while the depth map dimensions stay the same.
+
+        Args:
+            arr (NDArray): depth map (height x width) of uint16 pixels
 
         Returns:
             bytes: encoded bytes
         """
+        if self._depth_pixel_buf is None or self._depth_pixel_buf.shape != arr.shape:
+            self._allocate_depth_buf(arr.shape)
+        LOGGER.debug("Actual data size: %d", arr.nbytes)
+
+        # Copy data into rest of the buffer; cropped (non-contiguous) depth maps are copied directly too
+        np.copyto(self._depth_pixel_buf, arr)
+        return bytes(self._depth_buf)
+
+    def _allocate_depth_buf(self, shape: Tuple[int, int]) -> None:
+        """
+        Allocates the buffer used by `_encode_depth_raw` and writes its header.
+
+        Args:
+            shape (Tuple[int, int]): output dimensions of depth map (height x width)
+        """
         height, width = shape  # using np shape for actual output's height/width
         MAGIC_NUMBER = struct.pack(
             ">Q", 4919426490892632400
@@ -595,9 +648,13 @@ class Oak(Camera, Reconfigurable, Stoppable):
             MAGIC_BYTE_COUNT + WIDTH_BYTE_COUNT + HEIGHT_BYTE_COUNT + pixel_byte_count
         )
         LOGGER.debug(
-            f"Calculated size:  {MAGIC_BYTE_COUNT} + {WIDTH_BYTE_COUNT} + {HEIGHT_BYTE_COUNT} + {pixel_byte_count} = {total_byte_count}"
+            "Calculated size:  %d + %d + %d + %d = %d",
+            MAGIC_BYTE_COUNT,
+            WIDTH_BYTE_COUNT,
+            HEIGHT_BYTE_COUNT,
+            pixel_byte_count,
+            total_byte_count,
         )
-        LOGGER.debug(f"Actual data size: {len(data)}")
 
         # Create a bytearray to store the encoded data
         raw_buf = bytearray(total_byte_count)
@@ -613,9 +670,11 @@ class Oak(Camera, Reconfigurable, Stoppable):
         raw_buf[offset : offset + HEIGHT_BYTE_COUNT] = height_to_encode
         offset += HEIGHT_BYTE_COUNT
 
-        # Copy data into rest of the buffer
-        raw_buf[offset : offset + pixel_byte_count] = data
-        return bytes(raw_buf)
+        # Pixels are written in place into the rest of the buffer through this view
+        self._depth_buf = raw_buf
+        self._depth_pixel_buf = np.frombuffer(
+            raw_buf, dtype=np.uint16, offset=offset
+        ).reshape(height, width)
 
     def _validate_get_image_mime_type(
         self, mime_type: CameraMimeType
@@ -1,7 +1,6 @@
 import asyncio
 from collections import OrderedDict
 import math
-from queue import Empty
 import time
 from typing import (
     Callable,
@@ -14,16 +13,15 @@ from typing import (
 )
 
 from logging import Logger
-from threading import Lock
+from threading import Condition, Event, Lock
 
-import cv2
 import depthai as dai
 from depthai_sdk import OakCamera
 from depthai_sdk.classes.packets import BasePacket
-from depthai_sdk.classes.packet_handlers import QueuePacketHandler
 from depthai_sdk.components.camera_component import CameraComponent
-from depthai_sdk.components.pointcloud_component import PointcloudComponent
+from depthai_sdk.components.pointcloud_helper import create_xyz
 from depthai_sdk.components.stereo_component import StereoComponent
+import numpy as np
 from numpy.typing import NDArray
 
 
@@ -40,22 +38,35 @@ DIMENSIONS_TO_COLOR_RES = {
 }  # color camera component only accepts this subset of depthai_sdk.components.camera_helper.colorResolutions
 
 MAX_GRPC_MESSAGE_BYTE_COUNT = 4194304  # Update this if the gRPC config ever changes
+# Point cloud coordinates are sent as float32, so this bounds the coordinates per message
+MAX_PCD_FLOAT32_ELEMENT_COUNT = (
+    MAX_GRPC_MESSAGE_BYTE_COUNT // np.dtype(np.float32).itemsize
+)
+
+FRAME_WAIT_TIMEOUT_SECONDS = 5
 
 
 class MessageSynchronizer:
     """
-    MessageSynchronizer manages synchronization of frame messages for color and depth data from OakCamera packet queues,
+    MessageSynchronizer manages synchronization of frame messages for color and depth data from OakCamera packet callbacks,
     maintaining an ordered dictionary of messages keyed chronologically by sequence number.
     """
 
+    # Enough sequence numbers for color and depth to meet even when depth (stereo + align) trails color
     MAX_MSGS_SIZE = 50
     msgs: OrderedDict[int, Dict[str, BasePacket]]
     write_lock: Lock
+    new_msg: Condition
+    stopped: bool
 
     def __init__(self):
         # msgs maps frame sequence number to a dictionary that maps frame_type (i.e. "color" or "depth") to a data packet
         self.msgs = OrderedDict()
         self.write_lock = Lock()
+        # Notified on every added message so readers block instead of polling
+        self.new_msg = Condition(self.write_lock)
+        # Set by close() so waiting readers give up once the worker stops
+        self.stopped = False
 
     def add_msg(
         self, msg: BasePacket, frame_type: Literal["color", "depth"], seq: int
@@ -67,35 +78,58 @@ class MessageSynchronizer:
 
             self.msgs.setdefault(seq, {})[frame_type] = msg
             self._cleanup_msgs()
+            self.new_msg.notify_all()
+
+    def close(self) -> None:
+        """
+        Wakes every waiting reader and makes them raise, since no more messages will arrive.
+        """
+        with self.write_lock:
+            self.stopped = True
+            self.new_msg.notify_all()
+
+    def get_synced_msgs(self) -> Dict[str, BasePacket]:
+        # Woken by whichever of the color and depth streams completes a synced pair first
+        with self.new_msg:
+            sync_msgs = self.new_msg.wait_for(
+                lambda: self.stopped or self._find_synced_msgs(),
+                timeout=FRAME_WAIT_TIMEOUT_SECONDS,
+            )
+        if self.stopped:
+            raise Exception(
+                "Worker stopped while waiting for synced color and depth frames."
+            )
+        if sync_msgs is None:
+            raise Exception("Timed out waiting for synced color and depth frames.")
+        return sync_msgs
 
-    def get_synced_msgs(self) -> Optional[Dict[str, BasePacket]]:
-        for sync_msgs in self.msgs.values():
+    def _find_synced_msgs(self) -> Optional[Dict[str, BasePacket]]:
+        # Traverse in reverse to get the most recent synced frames
+        for sync_msgs in reversed(self.msgs.values()):
             if len(sync_msgs) == 2:  # has both color and depth
                 return sync_msgs
         return None
 
-    def _add_msgs_from_queue(
-        self, frame_type: Literal["color", "depth"], queue_handler: QueuePacketHandler
-    ) -> None:
-        queue_obj = queue_handler.get_queue()
-        with queue_obj.mutex:
-            q_snapshot = list(queue_obj.queue)
-
-        for msg in q_snapshot:
-            self.add_msg(msg, frame_type, msg.get_sequence_num())
-
-    def get_most_recent_msg(
-        self, q_handler: QueuePacketHandler, frame_type: Literal["color", "depth"]
+    def get_most_recent_msg(self, frame_type: Literal["color", "depth"]) -> BasePacket:
+        with self.new_msg:
+            msg = self.new_msg.wait_for(
+                lambda: self.stopped or self._find_most_recent_msg(frame_type),
+                timeout=FRAME_WAIT_TIMEOUT_SECONDS,
+            )
+        if self.stopped:
+            raise Exception(f"Worker stopped while waiting for '{frame_type}' frame.")
+        if msg is None:
+            raise Exception(f"Timed out waiting for '{frame_type}' frame.")
+        return msg
+
+    def _find_most_recent_msg(
+        self, frame_type: Literal["color", "depth"]
     ) -> Optional[BasePacket]:
-        self._add_msgs_from_queue(frame_type, q_handler)
-        while len(self.msgs) < 1:
-            self._add_msgs_from_queue(frame_type, q_handler)
-            time.sleep(0.1)
         # Traverse in reverse to get the most recent
         for msg_dict in reversed(self.msgs.values()):
             if frame_type in msg_dict:
                 return msg_dict[frame_type]
-        raise Exception(f"No message of type '{frame_type}' in frame queue.")
+        return None
 
     def _cleanup_msgs(self):
         while len(self.msgs) > self.MAX_MSGS_SIZE:
@@ -106,8 +140,12 @@ class CapturedData:
     """
     CapturedData is image data with the data as an np array,
     plus the timestamp it was captured at.
+
+    Color data is left in the BGR channel order DepthAI outputs.
     """
 
+    __slots__ = ("np_array", "captured_at")
+
     def __init__(self, np_array: NDArray, captured_at: float) -> None:
         self.np_array = np_array
         self.captured_at = captured_at
@@ -119,9 +157,7 @@ class Worker:
     """
 
     oak: Optional[OakCamera]
-    color_q_handler: Optional[QueuePacketHandler]
-    depth_q_handler: Optional[QueuePacketHandler]
-    pc_q_handler: Optional[QueuePacketHandler]
+    message_synchronizer: MessageSynchronizer
 
     def __init__(
         self,
@@ -130,7 +166,6 @@ class Worker:
         frame_rate: float,
         user_wants_color: bool,
         user_wants_depth: bool,
-        user_wants_pc: bool,
         reconfigure: Callable[[None], None],
         logger: Logger,
     ) -> None:
@@ -142,20 +177,47 @@ class Worker:
         self.frame_rate = frame_rate
         self.user_wants_color = user_wants_color
         self.user_wants_depth = user_wants_depth
-        self.user_wants_pc = user_wants_pc
         self.reconfigure = reconfigure
         self.logger = logger
 
         # Managed objects
         self.oak = None
-        self.color_q_handler = None
-        self.depth_q_handler = None
-        self.pc_q_handler = None
+        # Created up front since packet callbacks can fire as soon as the pipeline starts
+        self.message_synchronizer = MessageSynchronizer()
+        # Per-pixel projection rays for building point clouds from depth maps
+        self._xyz = None
+
+        # Depth crop window, cached per outputted depth map shape
+        self._depth_input_shape = None
+        self._depth_crop = None
 
         # Flags for stopping busy loops
-        self.running = False
+        self._running_event = Event()
         self.starting_up = False
 
+    @property
+    def running(self) -> bool:
+        return self._running_event.is_set()
+
+    @running.setter
+    def running(self, value: bool) -> None:
+        if value:
+            self._running_event.set()
+        else:
+            self._running_event.clear()
+
+    def wait_until_running(self, timeout: Optional[float] = None) -> bool:
+        """
+        Blocks until the worker is running or the timeout elapses.
+
+        Args:
+            timeout (Optional[float], optional): Defaults to None and will wait with no timeout.
+
+        Returns:
+            bool: whether the worker is running
+        """
+        return self._running_event.wait(timeout)
+
     def start(self):
         self.starting_up = True
         self._init_oak_camera()
@@ -168,54 +230,50 @@ class Worker:
         self._config_oak_camera()
         self.oak.start()
 
-        self.message_synchronizer = MessageSynchronizer()
         self.running = True
         self.starting_up = False
 
     async def get_synced_color_depth_data(self) -> Tuple[CapturedData, CapturedData]:
-        while self.running:
-            self.message_synchronizer._add_msgs_from_queue(
-                "color", self.color_q_handler
-            )
-            self.message_synchronizer._add_msgs_from_queue(
-                "depth", self.depth_q_handler
-            )
-
-            color_and_depth_data = self._capture_synced_color_depth_data()
-            if color_and_depth_data:
-                return color_and_depth_data
-
-            self.logger.debug("Waiting for synced color and depth frames...")
-            await asyncio.sleep(0.001)
-
-    def get_color_image(self) -> Optional[CapturedData]:
-        color_msg = self.message_synchronizer.get_most_recent_msg(
-            self.color_q_handler, "color"
+        # Block in an executor thread so the event loop keeps running while waiting for frames
+        synced_msgs = await asyncio.get_running_loop().run_in_executor(
+            None, self.message_synchronizer.get_synced_msgs
         )
-        color_output = self._process_color_frame(color_msg.frame)
+        return self._capture_synced_color_depth_data(synced_msgs)
+
+    async def get_color_image(self) -> Optional[CapturedData]:
+        color_msg = await self._get_most_recent_msg("color")
         timestamp = color_msg.get_timestamp().total_seconds()
-        return CapturedData(color_output, timestamp)
+        return CapturedData(color_msg.frame, timestamp)
 
-    def get_depth_map(self) -> Optional[CapturedData]:
-        depth_msg = self.message_synchronizer.get_most_recent_msg(
-            self.depth_q_handler, "depth"
-        )
+    async def get_depth_map(self) -> Optional[CapturedData]:
+        depth_msg = await self._get_most_recent_msg("depth")
         depth_output = self._process_depth_frame(depth_msg.frame)
         timestamp = depth_msg.get_timestamp().total_seconds()
         return CapturedData(depth_output, timestamp)
 
-    def get_pcd(self) -> CapturedData:
-        pc_q = self.pc_q_handler.get_queue()
-        try:
-            pc_msg = pc_q.get(block=True, timeout=5)
-            if pc_msg.points.nbytes > MAX_GRPC_MESSAGE_BYTE_COUNT:
-                pc_output = self._downsample_pcd(pc_msg.points, pc_msg.points.nbytes)
-            else:
-                pc_output = pc_msg.points
-            timestamp = pc_msg.get_timestamp().total_seconds()
-            return CapturedData(pc_output, timestamp)
-        except Empty:
-            raise Exception("Timed out waiting for PCD.")
+    async def get_pcd(self) -> CapturedData:
+        """
+        Builds a point cloud from the most recent depth map. This is the same projection
+        depthai_sdk's point cloud component runs on every depth frame, but it is only
+        computed when requested, so the pipeline never has to be rebuilt to serve point clouds.
+        """
+        depth_msg = await self._get_most_recent_msg("depth")
+        depth_frame = depth_msg.msg.getFrame()  # uncropped, as the projection expects
+        height, width = depth_frame.shape
+        if self._xyz is None or self._xyz.shape[:2] != (height, width):
+            # float32 like the serialized points, regardless of NumPy's promotion rules
+            xyz = create_xyz(self.oak.device, width, height)
+            self._xyz = xyz.astype(np.float32, copy=False)
+
+        # The point cloud has the same shape as the projection rays
+        xyz = self._xyz
+        if xyz.size > MAX_PCD_FLOAT32_ELEMENT_COUNT:
+            # Subsample before projecting so skipped points are never computed
+            factor = self._get_pcd_subsample_factor(height, width, xyz.size)
+            xyz, depth_frame = xyz[::factor, ::factor], depth_frame[::factor, ::factor]
+        pc_output = xyz * np.expand_dims(depth_frame, axis=-1)
+        timestamp = depth_msg.get_timestamp().total_seconds()
+        return CapturedData(pc_output, timestamp)
 
     def stop(self) -> None:
         """
@@ -224,29 +282,42 @@ class Worker:
         self.logger.debug("Stopping worker.")
         self.starting_up = False
         self.running = False
-        if self.oak:
+        self.message_synchronizer.close()
+        if self.oak is not None:
             self.oak.close()
 
+    async def _get_most_recent_msg(
+        self, frame_type: Literal["color", "depth"]
+    ) -> BasePacket:
+        # Same executor wait as get_synced_color_depth_data
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self.message_synchronizer.get_most_recent_msg, frame_type
+        )
+
+    def _on_color_packet(self, packet: BasePacket) -> None:
+        self.message_synchronizer.add_msg(packet, "color", packet.get_sequence_num())
+
+    def _on_depth_packet(self, packet: BasePacket) -> None:
+        self.message_synchronizer.add_msg(packet, "depth", packet.get_sequence_num())
+
     def _capture_synced_color_depth_data(
-        self,
-    ) -> Optional[Tuple[CapturedData, CapturedData]]:
-        synced_color_msgs = self.message_synchronizer.get_synced_msgs()
-        if synced_color_msgs:
-            color_frame, depth_frame, timestamp = (
-                synced_color_msgs["color"].frame,
-                synced_color_msgs["depth"].frame,
-                synced_color_msgs["color"].get_timestamp().total_seconds(),
-            )
-            color_data = CapturedData(self._process_color_frame(color_frame), timestamp)
-            depth_data = CapturedData(self._process_depth_frame(depth_frame), timestamp)
-            return color_data, depth_data
+        self, synced_color_msgs: Dict[str, BasePacket]
+    ) -> Tuple[CapturedData, CapturedData]:
+        color_frame, depth_frame, timestamp = (
+            synced_color_msgs["color"].frame,
+            synced_color_msgs["depth"].frame,
+            synced_color_msgs["color"].get_timestamp().total_seconds(),
+        )
+        color_data = CapturedData(color_frame, timestamp)
+        depth_data = CapturedData(self._process_depth_frame(depth_frame), timestamp)
+        return color_data, depth_data
 
     def _init_oak_camera(self):
         """
         Blocks until the OakCamera is successfully initialized.
         """
         self.oak = None
-        while not self.oak and self.starting_up:
+        while self.oak is None and self.starting_up:
             try:
                 self.oak = OakCamera()
                 self.logger.debug("Successfully initialized OakCamera.")
@@ -259,20 +330,20 @@ class Worker:
         Safely configures the OakCamera.
         """
         try:
+            stage = "pipeline"
+            # Chunk size 0 sends each frame over XLink in one transfer, lowering latency
+            self.oak.config_pipeline(xlink_chunk=0)
+
             stage = "color"
             color = self._configure_color()
             if color:
-                self.color_q_handler = self.oak.queue(color, 30)
+                # Packets are pushed straight into the synchronizer from DepthAI's threads
+                self.oak.callback(color, self._on_color_packet)
 
             stage = "stereo"
             stereo = self._configure_stereo(color)
             if stereo:
-                self.depth_q_handler = self.oak.queue(stereo, 30)
-
-            stage = "point cloud"
-            pcc = self._configure_pc(stereo, color)
-            if pcc:
-                self.pc_q_handler = self.oak.queue(pcc, 5)
+                self.oak.callback(stereo, self._on_depth_packet)
 
         except Exception as e:
             msg = f"Error configuring OakCamera at stage '{stage}': {e}"
@@ -380,43 +451,52 @@ class Worker:
             return stereo
         return None
 
-    def _configure_pc(
-        self, stereo: Optional[StereoComponent], color: Optional[CameraComponent]
-    ) -> Optional[PointcloudComponent]:
+    def _process_depth_frame(self, arr: NDArray) -> NDArray:
+        if arr.shape != self._depth_input_shape:
+            self._depth_input_shape = arr.shape
+            self._depth_crop = self._get_depth_crop(arr.shape)
+        if self._depth_crop is None:
+            return arr
+        return arr[self._depth_crop]  # a view; no pixels are copied
+
+    def _get_depth_crop(self, shape: Tuple[int, ...]) -> Optional[Tuple[slice, slice]]:
         """
-        Creates and configures point cloud component— or doesn't
-        (based on the config)
+        Calculates the centered crop window that trims depth maps of the given shape
+        down to the configured height and width. Only computed when the shape changes.
+
+        Args:
+            shape (Tuple[int, ...]): shape of the outputted depth map
 
         Returns:
-            Union[PointcloudComponent, None]
+            Optional[Tuple[slice, slice]]: the rows and columns to keep, or None if no crop is needed
         """
-        if self.user_wants_pc:
-            self.logger.debug("Creating point cloud component.")
-            pcc = self.oak.create_pointcloud(stereo, color)
-            return pcc
-        return None
-
-    def _process_color_frame(self, arr: NDArray) -> NDArray:
-        # DepthAI outputs BGR; convert to RGB
-        return cv2.cvtColor(arr, cv2.COLOR_BGR2RGB)
-
-    def _process_depth_frame(self, arr: NDArray) -> NDArray:
-        if arr.shape[0] > self.height and arr.shape[1] > self.width:
+        if shape[0] > self.height and shape[1] > self.width:
             self.logger.debug(
-                f"Outputted depth map's shape is greater than specified in config: {arr.shape}; Manually resizing to {(self.height, self.width)}."
+                f"Outputted depth map's shape is greater than specified in config: {shape}; Manually resizing to {(self.height, self.width)}."
             )
-            top_left_x = (arr.shape[1] - self.width) // 2
-            top_left_y = (arr.shape[0] - self.height) // 2
-            return arr[
-                top_left_y : top_left_y + self.height,
-                top_left_x : top_left_x + self.width,
-            ]
-        return arr
-
-    def _downsample_pcd(self, arr: NDArray, byte_count: int) -> NDArray:
-        factor = byte_count // MAX_GRPC_MESSAGE_BYTE_COUNT + 1
+            top_left_x = (shape[1] - self.width) // 2
+            top_left_y = (shape[0] - self.height) // 2
+            return (
+                slice(top_left_y, top_left_y + self.height),
+                slice(top_left_x, top_left_x + self.width),
+            )
+        return None
+
+    def _get_pcd_subsample_factor(
+        self, height: int, width: int, element_count: int
+    ) -> int:
+        # Striding both axes by `factor` cuts the element count by roughly factor ** 2
+        factor = math.ceil(math.sqrt(element_count / MAX_PCD_FLOAT32_ELEMENT_COUNT))
+        elements_per_point = element_count // (height * width)
+        while (
+            math.ceil(height / factor) * math.ceil(width / factor) * elements_per_point
+            > MAX_PCD_FLOAT32_ELEMENT_COUNT
+        ):
+            factor += 1
         self.logger.warn(
-            f"PCD bytes ({byte_count}) > max gRPC bytes count ({MAX_GRPC_MESSAGE_BYTE_COUNT}). Subsampling by 1/{factor}."
+            "PCD bytes (%d) > max gRPC bytes count (%d). Subsampling by 1/%d.",
+            element_count * np.dtype(np.float32).itemsize,
+            MAX_GRPC_MESSAGE_BYTE_COUNT,
+            factor,
         )
-        arr = arr[::factor, ::factor, :]
-        return arr
+        return factor
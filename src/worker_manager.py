@@ -1,11 +1,14 @@
-from threading import Thread
-import time
-from typing import Callable
+import os
+from threading import Event, Thread
+from typing import Callable, List, Optional
 from logging import Logger
 
 from src.worker import Worker
 
 
+HEALTH_CHECK_INTERVAL_SECONDS = 3
+
+
 class WorkerManager(Thread):
     """
     WorkerManager starts then watches Worker, making sure the connection
@@ -17,24 +20,60 @@ class WorkerManager(Thread):
         worker: Worker,
         logger: Logger,
         reconfigure: Callable[[None], None],
+        cpu_affinity: Optional[List[int]] = None,
     ) -> None:
         self.worker = worker
         self.logger = logger
         self.reconfigure = reconfigure
+        self.cpu_affinity = cpu_affinity
+
+        # _wake_event only cuts the health check wait short; _stop_event says why
+        self._wake_event = Event()
+        self._stop_event = Event()
 
         super().__init__()
 
     def run(self) -> None:
         self.logger.debug("Starting worker manager.")
+        if self.cpu_affinity:
+            self._set_cpu_affinity()
+
         if not self.worker.running:
             self.worker.start()
         else:
             self.logger.warn("worker already running!")
 
-        while self.worker.running:
+        while self.worker.running and not self._stop_event.is_set():
             self.logger.debug("Checking if worker must be reconfigured.")
-            if self.worker.oak.device.isClosed():
-                self.logger.debug("Camera is closed. Reconfiguring worker.")
-                self.reconfigure()
-                self.worker.running = False
-            time.sleep(3)
+            if not self.worker.oak.device.isClosed():
+                # Device disconnects are not signalled, so keep checking periodically
+                self._wake_event.wait(HEALTH_CHECK_INTERVAL_SECONDS)
+                continue
+
+            # stop() sets the stop flag before it closes the camera,
+            # so checking it here means a stop is never mistaken for a disconnect
+            if self._stop_event.is_set():
+                return
+            self.logger.debug("Camera is closed. Reconfiguring worker.")
+            self.reconfigure()
+            self.worker.running = False
+
+    def _set_cpu_affinity(self) -> None:
+        """
+        Pins this thread to the configured CPUs. Threads DepthAI spawns while the
+        worker starts inherit the affinity, which keeps frame delivery off busy cores.
+        """
+        try:
+            os.sched_setaffinity(0, self.cpu_affinity)  # 0 is the calling thread
+            self.logger.debug(f"Set worker CPU affinity to {self.cpu_affinity}.")
+        except (AttributeError, OSError) as e:  # AttributeError on non-Linux platforms
+            self.logger.warn(f"Could not set CPU affinity to {self.cpu_affinity}: {e}")
+
+    def stop(self) -> None:
+        """
+        Stops watching the worker and stops the worker itself.
+        """
+        self.logger.debug("Stopping worker manager.")
+        self._stop_event.set()
+        self._wake_event.set()
+        self.worker.stop()
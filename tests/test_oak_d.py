@@ -155,6 +155,38 @@ only_received_width = (
     "received only one dimension attribute"
 )
 
+cpu_affinity_is_not_list = (
+    make_component_config({
+        "sensors": ["color", "depth"],
+        "cpu_affinity": 2
+    }),
+    "attribute must be a list_value"
+)
+
+cpu_affinity_is_empty_list = (
+    make_component_config({
+        "sensors": ["color", "depth"],
+        "cpu_affinity": []
+    }),
+    "attribute list cannot be empty"
+)
+
+cpu_affinity_has_non_number = (
+    make_component_config({
+        "sensors": ["color", "depth"],
+        "cpu_affinity": ["2"]
+    }),
+    "must only contain whole numbers >= 0"
+)
+
+cpu_affinity_has_negative = (
+    make_component_config({
+        "sensors": ["color", "depth"],
+        "cpu_affinity": [2, -1]
+    }),
+    "must only contain whole numbers >= 0"
+)
+
 configs_and_msgs = [
     invalid_attribute_name,
     sensors_not_present,
@@ -173,7 +205,11 @@ configs_and_msgs = [
     width_is_zero,
     width_is_negative,
     only_received_height,
-    only_received_width
+    only_received_width,
+    cpu_affinity_is_not_list,
+    cpu_affinity_is_empty_list,
+    cpu_affinity_has_non_number,
+    cpu_affinity_has_negative
 ]
 
 full_correct_config = make_component_config({
@@ -181,6 +217,7 @@ full_correct_config = make_component_config({
     "height_px": 800,
     "width_px": 1280,
     "frame_rate": 60,
+    "cpu_affinity": [2, 3],
 })
 
 @pytest.mark.parametrize("config,msg", configs_and_msgs)
@@ -0,0 +1,107 @@
+import threading
+import time
+
+import pytest
+
+from src.worker import MessageSynchronizer
+
+### Helpers
+
+class FakePacket:
+    def __init__(self, frame_type: str, seq: int) -> None:
+        self.frame_type = frame_type
+        self.seq = seq
+
+    def get_sequence_num(self) -> int:
+        return self.seq
+
+def add_packet(synchronizer: MessageSynchronizer, frame_type: str, seq: int) -> FakePacket:
+    packet = FakePacket(frame_type, seq)
+    synchronizer.add_msg(packet, frame_type, seq)
+    return packet
+
+def add_packets_later(synchronizer: MessageSynchronizer, packets, delay: float) -> threading.Thread:
+    def add():
+        for frame_type, seq in packets:
+            time.sleep(delay)
+            add_packet(synchronizer, frame_type, seq)
+    thread = threading.Thread(target=add)
+    thread.start()
+    return thread
+
+### Tests
+
+@pytest.mark.parametrize("depth_lag", [0, 1, 3, 7, 20])
+def test_synced_msgs_found_when_depth_trails_color(depth_lag):
+    synchronizer = MessageSynchronizer()
+    for seq in range(100):
+        add_packet(synchronizer, "color", seq)
+        if seq >= depth_lag:
+            add_packet(synchronizer, "depth", seq - depth_lag)
+
+    synced = synchronizer.get_synced_msgs()
+    assert synced["color"].seq == synced["depth"].seq == 99 - depth_lag
+
+def test_synced_msgs_are_most_recent_pair():
+    synchronizer = MessageSynchronizer()
+    for seq in range(3):
+        add_packet(synchronizer, "color", seq)
+        add_packet(synchronizer, "depth", seq)
+    add_packet(synchronizer, "color", 3)
+
+    synced = synchronizer.get_synced_msgs()
+    assert synced["color"].seq == 2
+
+def test_msgs_capped_at_max_size():
+    synchronizer = MessageSynchronizer()
+    for seq in range(MessageSynchronizer.MAX_MSGS_SIZE + 10):
+        add_packet(synchronizer, "color", seq)
+    assert len(synchronizer.msgs) == MessageSynchronizer.MAX_MSGS_SIZE
+    assert synchronizer.get_most_recent_msg("color").seq == MessageSynchronizer.MAX_MSGS_SIZE + 9
+
+def test_get_most_recent_msg_wakes_on_new_msg():
+    synchronizer = MessageSynchronizer()
+    add_packet(synchronizer, "depth", 0)
+    thread = add_packets_later(synchronizer, [("color", 1)], delay=0.1)
+
+    start = time.monotonic()
+    msg = synchronizer.get_most_recent_msg("color")
+    elapsed = time.monotonic() - start
+    thread.join()
+
+    assert msg.seq == 1
+    assert elapsed < 1
+
+def test_get_synced_msgs_wakes_when_either_stream_completes_pair():
+    synchronizer = MessageSynchronizer()
+    thread = add_packets_later(synchronizer, [("depth", 5), ("color", 5)], delay=0.1)
+
+    start = time.monotonic()
+    synced = synchronizer.get_synced_msgs()
+    elapsed = time.monotonic() - start
+    thread.join()
+
+    assert synced["color"].seq == synced["depth"].seq == 5
+    assert elapsed < 1
+
+def test_close_wakes_synced_msgs_wait_with_stopped_error():
+    synchronizer = MessageSynchronizer()
+    add_packet(synchronizer, "color", 0)
+    timer = threading.Timer(0.1, synchronizer.close)
+    timer.start()
+
+    start = time.monotonic()
+    with pytest.raises(Exception, match="Worker stopped"):
+        synchronizer.get_synced_msgs()
+    elapsed = time.monotonic() - start
+    timer.join()
+
+    assert elapsed < 1
+
+def test_get_most_recent_msg_raises_after_close():
+    synchronizer = MessageSynchronizer()
+    add_packet(synchronizer, "color", 0)
+    synchronizer.close()
+
+    with pytest.raises(Exception, match="Worker stopped"):
+        synchronizer.get_most_recent_msg("color")
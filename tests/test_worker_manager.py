@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.worker_manager import WorkerManager
+
+### Helpers
+
+class StubWorker:
+    def __init__(self) -> None:
+        self.running = False
+        self.on_is_closed = lambda: None
+        self.oak = SimpleNamespace(
+            device=SimpleNamespace(isClosed=lambda: self.on_is_closed())
+        )
+
+    def start(self) -> None:
+        self.running = True
+
+    def stop(self) -> None:
+        self.running = False
+
+def make_manager(worker: StubWorker) -> WorkerManager:
+    return WorkerManager(worker, MagicMock(), MagicMock())
+
+### Tests
+
+def test_closed_camera_triggers_reconfigure():
+    worker = StubWorker()
+    worker.on_is_closed = lambda: True
+    manager = make_manager(worker)
+
+    manager.run()
+
+    manager.reconfigure.assert_called_once()
+
+def test_stop_during_health_check_does_not_reconfigure():
+    worker = StubWorker()
+    manager = make_manager(worker)
+
+    def stop_then_report_closed() -> bool:
+        # stop() lands after run() has passed its loop check, then the camera reads as closed
+        manager.stop()
+        worker.running = True
+        return True
+
+    worker.on_is_closed = stop_then_report_closed
+
+    manager.run()
+
+    manager.reconfigure.assert_not_called()